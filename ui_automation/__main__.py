@@ -8,11 +8,16 @@ import sys
 from ui_automation.utils.logger import Logger
 from ui_automation.core.browser_factory import BrowserFactory
 from ui_automation.core.config_loader import ConfigLoader
+from ui_automation.core.parallel_runner import ParallelRunner
 
-def main():
-    """Main entry point for the UI automation framework."""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='UI Automation Framework')
+def _build_parser():
+    """
+    Build the command line argument parser.
+    
+    Returns:
+        ArgumentParser: Parser for the framework's command line options
+    """
+    parser = argparse.ArgumentParser(description='UI Automation Framework', allow_abbrev=False)
     parser.add_argument('--browser', default='chrome', help='Browser to use (chrome, firefox, edge, safari)')
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
     parser.add_argument('--env', default='default', help='Environment to use (default, dev, prod)')
@@ -21,8 +26,38 @@ def main():
     parser.add_argument('--report-dir', help='Directory for test reports')
     parser.add_argument('--screenshot-dir', help='Directory for screenshots')
     parser.add_argument('--data-dir', help='Directory for test data')
+    parser.add_argument('--workers', type=int, default=1, help='Number of parallel browser sessions')
+    parser.add_argument('--reuse-browser', action='store_true',
+                        help='Attach to a long-running Chrome (launching it if needed) with a clean session')
+    parser.add_argument('--remote-debugging-port', type=int, default=9222,
+                        help='Remote debugging port of the long-running Chrome')
+    return parser
+
+_PARSER = _build_parser()
+
+# Option defaults, used when main is called with keyword arguments
+_DEFAULTS = vars(_PARSER.parse_args([]))
+
+def main(argv=None, **kwargs):
+    """
+    Main entry point for the UI automation framework.
     
-    args = parser.parse_args()
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+        **kwargs: Options by destination name (e.g. browser='firefox', log_level='DEBUG');
+            when given, argv is ignored and no command line parsing is done
+            
+    Returns:
+        int: Exit code
+    """
+    if kwargs:
+        unknown = set(kwargs) - set(_DEFAULTS)
+        if unknown:
+            raise TypeError(f"Unknown options: {', '.join(sorted(unknown))}")
+        args = argparse.Namespace(**{**_DEFAULTS, **kwargs})
+    else:
+        # Parse command line arguments
+        args = _PARSER.parse_args(argv)
     
     # Setup logging
     log_level = getattr(logging, args.log_level.upper(), logging.INFO)
@@ -31,6 +66,7 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Starting UI Automation Framework")
     
+    runner = None
     try:
         # Load configuration
         config_loader = ConfigLoader()
@@ -45,12 +81,22 @@ def main():
             browser_config = config_loader.get_browser_config(args.env)
             test_config = config_loader.get_test_config(args.env)
         
-        # Create browser instance
-        browser_factory = BrowserFactory()
-        browser = browser_factory.create_browser(
-            browser_type=args.browser,
-            headless=args.headless
-        )
+        if args.workers > 1:
+            # Create parallel runner, one browser per worker
+            runner = ParallelRunner(
+                workers=args.workers,
+                browser_type=args.browser,
+                headless=args.headless
+            )
+        else:
+            # Create browser instance
+            browser_factory = BrowserFactory()
+            browser = browser_factory.create_browser(
+                browser_type=args.browser,
+                headless=args.headless,
+                reuse_browser=args.reuse_browser,
+                debug_port=args.remote_debugging_port
+            )
         
         # Additional setup and test execution would go here
         
@@ -61,7 +107,10 @@ def main():
         return 1
     finally:
         # Cleanup would go here
-        pass
+        if runner is not None:
+            runner.close()
+            runner.browser_factory.close_pool()
+        Logger.flush()
 
 if __name__ == "__main__":
     sys.exit(main())
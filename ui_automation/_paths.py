@@ -0,0 +1,13 @@
+"""
+Default directory locations for UI automation framework.
+"""
+import os
+
+# Project root is the directory containing the ui_automation package
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONFIG_DIR = os.path.join(PROJECT_ROOT, 'config')
+DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+LOGS_DIR = os.path.join(PROJECT_ROOT, 'logs')
+REPORTS_DIR = os.path.join(PROJECT_ROOT, 'reports')
+SCREENSHOTS_DIR = os.path.join(PROJECT_ROOT, 'screenshots')
@@ -4,9 +4,34 @@ Provides common methods for interacting with web elements.
 """
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
+from collections import OrderedDict
+from contextlib import contextmanager
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of located elements remembered per page object
+ELEMENT_CACHE_SIZE = 128
+
+# Resolves with [title, url] once the document has finished loading,
+# or once the DOM is ready when arguments[0] (eager) is true
+PAGE_LOAD_SCRIPT = """
+var eager = arguments[0];
+var done = arguments[arguments.length - 1];
+function report() { done([document.title, location.href]); }
+if (document.readyState === 'complete' || (eager && document.readyState === 'interactive')) {
+    report();
+} else {
+    window.addEventListener(eager ? 'DOMContentLoaded' : 'load', report, { once: true });
+}
+"""
+
+# Browser names reported by drivers that support Chrome DevTools Protocol commands
+CHROMIUM_BROWSERS = ('chrome', 'msedge', 'MicrosoftEdge')
+
 class BasePage:
     """Base class for all page objects."""
     
@@ -19,12 +44,20 @@ class BasePage:
         """
         self.browser = browser
         self.timeout = 10
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        self._elem_cache = OrderedDict()
+        self._implicit_wait = None
+        self._script_timeout = None
+        self._page_info = None
     
     def find_element(self, locator):
         """
         Find an element using the locator provided.
         
+        The element is always looked up afresh, and is cached per locator
+        for the actions of this class (click, type_text, get_text), which
+        look it up again if it has gone stale.
+        
         Args:
             locator: A tuple of (By, path) e.g. (By.ID, 'example')
             
@@ -34,11 +67,81 @@ class BasePage:
         Raises:
             NoSuchElementException: If element is not found
         """
+        self._page_info = None
         try:
-            return self.browser.find_element(*locator)
+            element = self.browser.find_element(*locator)
         except NoSuchElementException as e:
-            self.logger.error(f"Element not found with locator: {locator}")
+            logger.error("Element not found with locator: %s", locator)
             raise e
+        
+        self._remember(locator, element)
+        return element
+    
+    def clear_element_cache(self):
+        """Forget all cached elements."""
+        self._elem_cache.clear()
+    
+    def _remember(self, locator, element):
+        """
+        Store an element located elsewhere (e.g. by a wait) in the element cache.
+        
+        Args:
+            locator: A tuple of (By, path)
+            element: WebElement found for the locator
+        """
+        key = tuple(locator)
+        self._elem_cache[key] = element
+        self._elem_cache.move_to_end(key)
+        if len(self._elem_cache) > ELEMENT_CACHE_SIZE:
+            self._elem_cache.popitem(last=False)
+    
+    def _resolve(self, locator_or_element):
+        """
+        Get a WebElement from a locator or an already resolved element.
+        
+        Locators are looked up in the element cache first; callers must be
+        prepared for the cached element to be stale (see _on_element).
+        
+        Args:
+            locator_or_element: A tuple of (By, path) or a WebElement
+            
+        Returns:
+            WebElement: The element
+        """
+        self._page_info = None
+        if isinstance(locator_or_element, WebElement):
+            return locator_or_element
+        
+        key = tuple(locator_or_element)
+        element = self._elem_cache.get(key)
+        if element is not None:
+            self._elem_cache.move_to_end(key)
+            return element
+        return self.find_element(locator_or_element)
+    
+    def _on_element(self, locator_or_element, action):
+        """
+        Apply an action to an element.
+        
+        If the element came from the cache and has gone stale it is looked
+        up again once.
+        
+        Args:
+            locator_or_element: A tuple of (By, path) or a WebElement
+            action: Callable taking the WebElement
+            
+        Returns:
+            The result of the action
+        """
+        element = self._resolve(locator_or_element)
+        if element is locator_or_element:
+            return action(element)
+        
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self._elem_cache.pop(tuple(locator_or_element), None)
+            return action(self.find_element(locator_or_element))
     
     def find_elements(self, locator):
         """
@@ -50,44 +153,73 @@ class BasePage:
         Returns:
             List[WebElement]: List of found elements
         """
+        self._page_info = None
         return self.browser.find_elements(*locator)
     
-    def click(self, locator):
+    def click(self, locator_or_element):
         """
         Click on an element.
         
         Args:
-            locator: A tuple of (By, path)
+            locator_or_element: A tuple of (By, path) or a WebElement
         """
-        element = self.find_element(locator)
-        element.click()
-        self.logger.info(f"Clicked on element with locator: {locator}")
+        self._page_info = None
+        self._on_element(locator_or_element, lambda element: element.click())
+        logger.info("Clicked on element with locator: %s", locator_or_element)
     
-    def type_text(self, locator, text):
+    def type_text(self, locator_or_element, text, clear=True, select_all=False):
         """
         Type text into an element.
         
+        With select_all, the existing content is replaced by select-all and
+        delete keystrokes sent together with the text, so clearing costs no
+        extra wire call. Only use it for plain text fields: file inputs take
+        the whole key sequence as the path, and date, number and
+        contenteditable fields may not clear the same way as clear().
+        
         Args:
-            locator: A tuple of (By, path)
+            locator_or_element: A tuple of (By, path) or a WebElement
             text: Text to type
+            clear: Whether to replace existing content (skip for fields known to be empty)
+            select_all: Clear with keystrokes instead of a separate clear() call
         """
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
-        self.logger.info(f"Typed '{text}' into element with locator: {locator}")
+        if clear and select_all:
+            keys = (self._select_all_key(), 'a', Keys.NULL, Keys.DELETE, text)
+            action = lambda element: element.send_keys(*keys)
+        elif clear:
+            def action(element):
+                element.clear()
+                element.send_keys(text)
+        else:
+            action = lambda element: element.send_keys(text)
+        
+        self._page_info = None
+        self._on_element(locator_or_element, action)
+        logger.info("Typed '%s' into element with locator: %s", text, locator_or_element)
     
-    def get_text(self, locator):
+    def _select_all_key(self):
+        """
+        Get the modifier key used with 'a' to select all text.
+        
+        Returns:
+            str: Keys.COMMAND on macOS, Keys.CONTROL elsewhere
+        """
+        platform = str(self.browser.capabilities.get('platformName', '')).lower()
+        if platform.startswith('mac'):
+            return Keys.COMMAND
+        return Keys.CONTROL
+    
+    def get_text(self, locator_or_element):
         """
         Get text from an element.
         
         Args:
-            locator: A tuple of (By, path)
+            locator_or_element: A tuple of (By, path) or a WebElement
             
         Returns:
             str: Text of the element
         """
-        element = self.find_element(locator)
-        return element.text
+        return self._on_element(locator_or_element, lambda element: element.text)
     
     def is_element_present(self, locator):
         """
@@ -99,16 +231,39 @@ class BasePage:
         Returns:
             bool: True if element is present, False otherwise
         """
+        self._page_info = None
+        with self._no_implicit_wait():
+            return len(self.browser.find_elements(*locator)) > 0
+    
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Temporarily disable the browser's implicit wait.
+        
+        Negative checks return immediately instead of blocking for the full
+        implicit wait. The implicit wait is read from the browser on first
+        use and restored on exit.
+        """
+        if self._implicit_wait is None:
+            self._implicit_wait = self.browser.timeouts.implicit_wait
+        
+        if not self._implicit_wait:
+            yield
+            return
+        
+        self.browser.implicitly_wait(0)
         try:
-            self.find_element(locator)
-            return True
-        except NoSuchElementException:
-            return False
+            yield
+        finally:
+            self.browser.implicitly_wait(self._implicit_wait)
     
     def wait_for_element_visible(self, locator, timeout=None):
         """
         Wait for an element to be visible.
         
+        The element is cached, so a following action on the same locator
+        does not look it up again.
+        
         Args:
             locator: A tuple of (By, path)
             timeout: Time to wait in seconds (default: self.timeout)
@@ -121,20 +276,25 @@ class BasePage:
         """
         if timeout is None:
             timeout = self.timeout
-            
+        
+        self._page_info = None
         try:
             element = WebDriverWait(self.browser, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
+            self._remember(locator, element)
             return element
         except TimeoutException as e:
-            self.logger.error(f"Element not visible within {timeout} seconds: {locator}")
+            logger.error("Element not visible within %s seconds: %s", timeout, locator)
             raise e
     
     def wait_for_element_clickable(self, locator, timeout=None):
         """
         Wait for an element to be clickable.
         
+        The element is cached, so a following click on the same locator
+        does not look it up again.
+        
         Args:
             locator: A tuple of (By, path)
             timeout: Time to wait in seconds (default: self.timeout)
@@ -147,71 +307,185 @@ class BasePage:
         """
         if timeout is None:
             timeout = self.timeout
-            
+        
+        self._page_info = None
         try:
             element = WebDriverWait(self.browser, timeout).until(
                 EC.element_to_be_clickable(locator)
             )
+            self._remember(locator, element)
             return element
         except TimeoutException as e:
-            self.logger.error(f"Element not clickable within {timeout} seconds: {locator}")
+            logger.error("Element not clickable within %s seconds: %s", timeout, locator)
             raise e
     
     def wait_for_page_load(self, timeout=None):
         """
         Wait for page to load completely.
         
+        A single asynchronous script resolves on the window load event
+        instead of polling document.readyState over the wire. The browser's
+        script timeout is set to the given timeout for the wait and
+        restored afterwards.
+        
         Args:
             timeout: Time to wait in seconds (default: self.timeout)
             
+        Raises:
+            TimeoutException: If page does not load within timeout
+        """
+        self._wait_for_load(timeout)
+    
+    def _wait_for_load(self, timeout=None, eager=False):
+        """
+        Wait for page to load completely and read its title and URL.
+        
+        Args:
+            timeout: Time to wait in seconds (default: self.timeout)
+            eager: Only wait until the DOM is ready, not for subresources
+            
+        Returns:
+            tuple: (title, url) of the loaded page
+            
         Raises:
             TimeoutException: If page does not load within timeout
         """
         if timeout is None:
             timeout = self.timeout
             
+        # Read the session's own script timeout once, to restore it after each wait
+        if self._script_timeout is None:
+            self._script_timeout = self.browser.timeouts.script
+        
+        self.browser.set_script_timeout(timeout)
         try:
-            WebDriverWait(self.browser, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
+            title, url = self.browser.execute_async_script(PAGE_LOAD_SCRIPT, eager)
+            return title, url
         except TimeoutException as e:
-            self.logger.error(f"Page did not load within {timeout} seconds")
+            logger.error("Page did not load within %s seconds", timeout)
             raise e
+        finally:
+            self.browser.set_script_timeout(self._script_timeout)
     
     def get_title(self):
         """
         Get the title of the current page.
         
+        The first call after navigate_to returns the title read while
+        waiting for the page to load, without a wire call, unless the page
+        object has been used to find or act on elements in between.
+        
         Returns:
             str: Page title
         """
+        title = self._take_page_info(0)
+        if title is not None:
+            return title
         return self.browser.title
     
     def get_current_url(self):
         """
         Get the URL of the current page.
         
+        The first call after navigate_to returns the URL read while
+        waiting for the page to load, without a wire call, unless the page
+        object has been used to find or act on elements in between.
+        
         Returns:
             str: Current URL
         """
+        url = self._take_page_info(1)
+        if url is not None:
+            return url
         return self.browser.current_url
     
+    def _take_page_info(self, index):
+        """
+        Take a value read during the last page load wait, so it is used only once.
+        
+        Later reads go to the browser, since the page may have changed
+        through redirects or actions outside this page object.
+        
+        Args:
+            index: 0 for the title, 1 for the URL
+            
+        Returns:
+            str or None: The value, or None if it is unavailable or already used
+        """
+        if self._page_info is None:
+            return None
+        value = self._page_info[index]
+        self._page_info[index] = None
+        return value
+    
     def refresh_page(self):
-        """Refresh the current page."""
+        """
+        Refresh the current page.
+        
+        refresh() already blocks until the page is loaded, so no extra
+        load wait is made unless the page load strategy is 'none'.
+        """
         self.browser.refresh()
-        self.wait_for_page_load()
-        self.logger.info("Page refreshed")
+        self._elem_cache.clear()
+        self._page_info = None
+        if self._page_load_strategy() == 'none':
+            self._page_info = list(self._wait_for_load())
+        logger.info("Page refreshed")
     
     def navigate_to(self, url):
         """
         Navigate to the specified URL.
         
+        On Chrome and Edge the navigation is issued as a DevTools
+        Page.navigate command, and the load wait also reads the page
+        title and URL, so get_title and get_current_url need no further
+        wire calls. Other browsers use get(), which already blocks until
+        the page is loaded, so no extra load wait is made unless the page
+        load strategy is 'none'.
+        
+        With the 'eager' page load strategy the wait ends once the DOM is
+        ready instead of waiting for images and other subresources, which
+        further reduces the cost of each navigation.
+        
         Args:
             url: URL to navigate to
+            
+        Raises:
+            WebDriverException: If the browser reports a navigation error
+        """
+        self._elem_cache.clear()
+        self._page_info = None
+        
+        if self._supports_cdp():
+            result = self.browser.execute_cdp_cmd("Page.navigate", {"url": url})
+            if result.get('errorText'):
+                raise WebDriverException(f"Failed to navigate to {url}: {result['errorText']}")
+            self._page_info = list(self._wait_for_load(eager=self._page_load_strategy() == 'eager'))
+        else:
+            self.browser.get(url)
+            if self._page_load_strategy() == 'none':
+                self._page_info = list(self._wait_for_load())
+        
+        logger.info("Navigated to URL: %s", url)
+    
+    def _page_load_strategy(self):
+        """
+        Get the page load strategy the browser session was created with.
+        
+        Returns:
+            str: 'normal', 'eager' or 'none'
+        """
+        return self.browser.capabilities.get('pageLoadStrategy', 'normal')
+    
+    def _supports_cdp(self):
+        """
+        Check whether the browser accepts Chrome DevTools Protocol commands.
+        
+        Returns:
+            bool: True for local Chrome and Edge drivers
         """
-        self.browser.get(url)
-        self.wait_for_page_load()
-        self.logger.info(f"Navigated to URL: {url}")
+        return (self.browser.capabilities.get('browserName') in CHROMIUM_BROWSERS
+                and hasattr(self.browser, 'execute_cdp_cmd'))
     
     def switch_to_frame(self, frame_reference):
         """
@@ -221,12 +495,14 @@ class BasePage:
             frame_reference: Frame reference (id, name, index, or WebElement)
         """
         self.browser.switch_to.frame(frame_reference)
-        self.logger.info(f"Switched to frame: {frame_reference}")
+        self._elem_cache.clear()
+        logger.info("Switched to frame: %s", frame_reference)
     
     def switch_to_default_content(self):
         """Switch back to the default content."""
         self.browser.switch_to.default_content()
-        self.logger.info("Switched back to default content")
+        self._elem_cache.clear()
+        logger.info("Switched back to default content")
     
     def execute_script(self, script, *args):
         """
@@ -239,4 +515,5 @@ class BasePage:
         Returns:
             The result of the script execution
         """
+        self._page_info = None
         return self.browser.execute_script(script, *args)
@@ -2,30 +2,105 @@
 Browser factory for creating WebDriver instances.
 """
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.safari.service import Service as SafariService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+import functools
 import logging
 import os
+import queue
+import socket
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Default number of idle browsers kept per (browser_type, headless) key
+DEFAULT_POOL_SIZE = 4
+
+# Number of checkouts after which a pooled browser is quit instead of recycled
+MAX_USES_PER_INSTANCE = 50
+
+# Idle browsers shared by all factories, keyed by (browser_type, headless)
+_POOL = {}
+_POOL_LOCK = threading.Lock()
+
+# Default Chrome remote debugging port used when reusing a running browser
+DEFAULT_DEBUG_PORT = 9222
+
+def _serialized(func):
+    """
+    Serialize calls to a function.
+    
+    lru_cache does not deduplicate concurrent calls on a cold cache, so
+    without this parallel workers would each run a driver install.
+    """
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper():
+        with lock:
+            return func()
+    return wrapper
+
+@_serialized
+@functools.lru_cache(maxsize=None)
+def _chrome_driver_path():
+    """Resolve the chromedriver binary once per process."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+@_serialized
+@functools.lru_cache(maxsize=None)
+def _gecko_driver_path():
+    """Resolve the geckodriver binary once per process."""
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+@_serialized
+@functools.lru_cache(maxsize=None)
+def _edge_driver_path():
+    """Resolve the msedgedriver binary once per process."""
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager
+    return EdgeChromiumDriverManager().install()
+
+def _debugger_listening(port):
+    """Check whether a browser is accepting remote debugging connections on a local port."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
 
 class BrowserFactory:
     """Factory class for creating WebDriver instances."""
     
-    def __init__(self):
-        """Initialize the browser factory."""
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, max_uses=MAX_USES_PER_INSTANCE):
+        """
+        Initialize the browser factory.
+        
+        Args:
+            pool_size: Maximum number of idle browsers kept per browser type
+            max_uses: Number of uses after which a browser is quit instead of recycled
+        """
+        self.logger = logger
+        self.pool_size = pool_size
+        self.max_uses = max_uses
     
-    def create_browser(self, browser_type="chrome", headless=False):
+    def create_browser(self, browser_type="chrome", headless=False, reuse_browser=False,
+                       debug_port=DEFAULT_DEBUG_PORT):
         """
         Create a WebDriver instance for the specified browser.
         
+        An idle browser previously returned with release_browser is reused
+        when one is available for the same browser type and headless mode.
+        
+        With reuse_browser, Chrome is attached to a browser already listening
+        on debug_port, with its cookies and storage cleared. If none is
+        listening, a browser is launched on that port and left running for
+        later runs. Reused browsers are not pooled; quitting one closes it.
+        
         Args:
             browser_type: Type of browser ('chrome', 'firefox', 'edge', 'safari')
             headless: Whether to run in headless mode
+            reuse_browser: Whether to reuse a long-running Chrome across runs
+            debug_port: Remote debugging port of the long-running Chrome
             
         Returns:
             WebDriver: Browser instance
@@ -34,32 +109,179 @@ class BrowserFactory:
             ValueError: If browser_type is not supported
         """
         browser_type = browser_type.lower()
-        self.logger.info(f"Creating {browser_type} browser (headless: {headless})")
+        key = (browser_type, headless)
+        
+        if reuse_browser:
+            if browser_type == "chrome":
+                return self._create_chrome(headless, debug_port=debug_port)
+            logger.warning("Browser reuse is only supported for Chrome, creating a new %s browser", browser_type)
+        
+        driver = self._checkout(key)
+        if driver is not None:
+            logger.info("Reusing pooled %s browser (headless: %s)", browser_type, headless)
+            return driver
+        
+        logger.info("Creating %s browser (headless: %s)", browser_type, headless)
         
         if browser_type == "chrome":
-            return self._create_chrome(headless)
+            driver = self._create_chrome(headless)
         elif browser_type == "firefox":
-            return self._create_firefox(headless)
+            driver = self._create_firefox(headless)
         elif browser_type == "edge":
-            return self._create_edge(headless)
+            driver = self._create_edge(headless)
         elif browser_type == "safari":
-            return self._create_safari()
+            driver = self._create_safari()
         else:
             raise ValueError(f"Unsupported browser type: {browser_type}")
+        
+        driver._pool_key = key
+        driver._use_count = 1
+        return driver
+    
+    def release_browser(self, driver, key=None):
+        """
+        Return a browser to the pool for reuse.
+        
+        Cookies and web storage are cleared and the browser is left on
+        about:blank before it is pooled. On Chrome and Edge cookies are
+        cleared for all sites; local storage, IndexedDB and session storage
+        only for the current origin. Elsewhere cookies and storage are
+        cleared for the current origin only. The browser is quit instead if it has reached max_uses,
+        cannot be cleaned, or this factory's pool_size idle browsers are
+        already pooled for its key.
+        
+        Args:
+            driver: WebDriver instance obtained from create_browser
+            key: Pool key (browser_type, headless) (default: key recorded at creation)
+        """
+        if key is None:
+            key = getattr(driver, '_pool_key', None)
+        
+        if key is None or getattr(driver, '_use_count', 0) >= self.max_uses:
+            self._quit(driver)
+            return
+        
+        try:
+            if key[0] in ('chrome', 'edge'):
+                self._clear_session(driver)
+            else:
+                driver.delete_all_cookies()
+                driver.execute_script(
+                    "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+                )
+            driver.get("about:blank")
+        except Exception as e:
+            logger.warning("Failed to clean browser session, quitting it: %s", e)
+            self._quit(driver)
+            return
+        
+        # The pool is unbounded and each factory enforces its own pool_size,
+        # so the limit does not depend on which factory released first
+        with _POOL_LOCK:
+            pool = _POOL.get(key)
+            if pool is None:
+                pool = _POOL[key] = queue.Queue()
+            pooled = pool.qsize() < self.pool_size
+            if pooled:
+                pool.put_nowait(driver)
+        
+        if pooled:
+            logger.info("Released %s browser to pool", key[0])
+        else:
+            self._quit(driver)
     
-    def _create_chrome(self, headless=False):
+    def quit_browser(self, driver):
+        """
+        Quit a browser instead of returning it to the pool.
+        
+        Args:
+            driver: WebDriver instance obtained from create_browser
+        """
+        self._quit(driver)
+    
+    def close_pool(self):
+        """Quit all idle browsers held in the pool."""
+        with _POOL_LOCK:
+            pools = list(_POOL.values())
+            _POOL.clear()
+        
+        for pool in pools:
+            while True:
+                try:
+                    driver = pool.get_nowait()
+                except queue.Empty:
+                    break
+                self._quit(driver)
+    
+    def _checkout(self, key):
+        """
+        Take an idle browser from the pool.
+        
+        Args:
+            key: Pool key (browser_type, headless)
+            
+        Returns:
+            WebDriver or None: Pooled browser instance, None if none is idle
+        """
+        with _POOL_LOCK:
+            pool = _POOL.get(key)
+        
+        if pool is None:
+            return None
+        
+        try:
+            driver = pool.get_nowait()
+        except queue.Empty:
+            return None
+        
+        driver._use_count += 1
+        return driver
+    
+    def _quit(self, driver):
+        """
+        Quit a browser, logging instead of raising on failure.
+        
+        Args:
+            driver: WebDriver instance
+        """
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Failed to quit browser: %s", e)
+    
+    def _create_chrome(self, headless=False, debug_port=None):
         """
         Create a Chrome WebDriver instance.
         
         Args:
             headless: Whether to run in headless mode
+            debug_port: Remote debugging port to attach to, or to launch a
+                long-running browser on (default: launch a regular browser)
             
         Returns:
             WebDriver: Chrome browser instance
         """
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        
+        if debug_port is not None and _debugger_listening(debug_port):
+            return self._attach_chrome(debug_port)
+        
         options = webdriver.ChromeOptions()
+        
+        # Return from navigation once the DOM is ready instead of waiting for all subresources
+        options.page_load_strategy = 'eager'
+        
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        
         if headless:
             options.add_argument("--headless")
+            
+            # Skip work that only matters to a visible, interactive browser
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-sync")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            prefs["profile.managed_default_content_settings.images"] = 2
         
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
@@ -69,18 +291,68 @@ class BrowserFactory:
         # Add experimental options
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        options.add_experimental_option("prefs", prefs)
+        
+        if debug_port is not None:
+            # Keep the browser running after this session so later runs can attach to it
+            options.add_argument(f"--remote-debugging-port={debug_port}")
+            options.add_experimental_option("detach", True)
         
         try:
             driver = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager().install()),
+                service=ChromeService(_chrome_driver_path()),
                 options=options
             )
-            self.logger.info("Chrome browser created successfully")
+            logger.info("Chrome browser created successfully")
             return driver
         except Exception as e:
-            self.logger.error(f"Failed to create Chrome browser: {str(e)}")
+            logger.error("Failed to create Chrome browser: %s", e)
             raise
     
+    def _attach_chrome(self, debug_port):
+        """
+        Attach to a running Chrome and clear its session state.
+        
+        Args:
+            debug_port: Remote debugging port of the running browser
+            
+        Returns:
+            WebDriver: Chrome browser instance
+        """
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        
+        options = webdriver.ChromeOptions()
+        options.page_load_strategy = 'eager'
+        options.add_experimental_option("debuggerAddress", f"127.0.0.1:{debug_port}")
+        
+        try:
+            driver = webdriver.Chrome(
+                service=ChromeService(_chrome_driver_path()),
+                options=options
+            )
+            self._clear_session(driver)
+            logger.info("Attached to Chrome browser on port %s", debug_port)
+            return driver
+        except Exception as e:
+            logger.error("Failed to attach to Chrome browser on port %s: %s", debug_port, e)
+            raise
+    
+    def _clear_session(self, driver):
+        """
+        Clear cookies for all sites, and storage (including session storage) for the current origin.
+        
+        Args:
+            driver: Chrome WebDriver instance
+        """
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        
+        # Storage.clearDataForOrigin does not cover session storage, so clear it from the page
+        origin = driver.execute_script(
+            "try { window.sessionStorage.clear(); } catch (e) {} return location.origin;"
+        )
+        if origin and origin != 'null':
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    
     def _create_firefox(self, headless=False):
         """
         Create a Firefox WebDriver instance.
@@ -91,19 +363,21 @@ class BrowserFactory:
         Returns:
             WebDriver: Firefox browser instance
         """
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        
         options = webdriver.FirefoxOptions()
         if headless:
             options.add_argument("--headless")
         
         try:
             driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
+                service=FirefoxService(_gecko_driver_path()),
                 options=options
             )
-            self.logger.info("Firefox browser created successfully")
+            logger.info("Firefox browser created successfully")
             return driver
         except Exception as e:
-            self.logger.error(f"Failed to create Firefox browser: {str(e)}")
+            logger.error("Failed to create Firefox browser: %s", e)
             raise
     
     def _create_edge(self, headless=False):
@@ -116,6 +390,8 @@ class BrowserFactory:
         Returns:
             WebDriver: Edge browser instance
         """
+        from selenium.webdriver.edge.service import Service as EdgeService
+        
         options = webdriver.EdgeOptions()
         if headless:
             options.add_argument("--headless")
@@ -127,13 +403,13 @@ class BrowserFactory:
         
         try:
             driver = webdriver.Edge(
-                service=EdgeService(EdgeChromiumDriverManager().install()),
+                service=EdgeService(_edge_driver_path()),
                 options=options
             )
-            self.logger.info("Edge browser created successfully")
+            logger.info("Edge browser created successfully")
             return driver
         except Exception as e:
-            self.logger.error(f"Failed to create Edge browser: {str(e)}")
+            logger.error("Failed to create Edge browser: %s", e)
             raise
     
     def _create_safari(self):
@@ -143,10 +419,12 @@ class BrowserFactory:
         Returns:
             WebDriver: Safari browser instance
         """
+        from selenium.webdriver.safari.service import Service as SafariService
+        
         try:
             driver = webdriver.Safari(service=SafariService())
-            self.logger.info("Safari browser created successfully")
+            logger.info("Safari browser created successfully")
             return driver
         except Exception as e:
-            self.logger.error(f"Failed to create Safari browser: {str(e)}")
+            logger.error("Failed to create Safari browser: %s", e)
             raise
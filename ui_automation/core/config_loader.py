@@ -4,12 +4,42 @@ Configuration loader for UI automation framework.
 import yaml
 import json
 import os
+import copy
 import logging
+import functools
 from typing import Dict, Any, Optional
+from ui_automation._paths import CONFIG_DIR
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
+# Supported configuration file extensions, in lookup order
+CONFIG_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(file_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file; cached per (path, mtime) so edits are picked up. Callers must copy before modifying."""
+    with open(file_path, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+@functools.lru_cache(maxsize=32)
+def _parse_json(file_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON file; cached per (path, mtime) so edits are picked up. Callers must copy before modifying."""
+    with open(file_path, 'r') as file:
+        return json.load(file)
 
 class ConfigLoader:
     """Class for loading configuration from YAML or JSON files."""
     
+    # Resolved configuration file paths, keyed by (config_dir, config_name).
+    # Misses are not cached, so files created later are still found
+    _PATH_CACHE: Dict[tuple, str] = {}
+    
     def __init__(self, config_dir: str = None):
         """
         Initialize the config loader.
@@ -17,9 +47,15 @@ class ConfigLoader:
         Args:
             config_dir: Directory containing configuration files
         """
-        self.logger = logging.getLogger(__name__)
-        self.config_dir = config_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config')
-        self.config_cache = {}
+        self.logger = logger
+        self.config_dir = config_dir or CONFIG_DIR
+    
+    @classmethod
+    def clear_cache(cls):
+        """Forget all parsed configurations and resolved file paths."""
+        _parse_yaml.cache_clear()
+        _parse_json.cache_clear()
+        cls._PATH_CACHE.clear()
     
     def load_config(self, config_name: str, environment: str = 'default') -> Dict[str, Any]:
         """
@@ -36,10 +72,6 @@ class ConfigLoader:
             FileNotFoundError: If configuration file is not found
             ValueError: If configuration file format is not supported
         """
-        cache_key = f"{config_name}_{environment}"
-        if cache_key in self.config_cache:
-            return self.config_cache[cache_key]
-        
         # Try to load environment-specific config
         config_data = self._try_load_config(f"{config_name}_{environment}")
         
@@ -50,7 +82,6 @@ class ConfigLoader:
         if config_data is None:
             raise FileNotFoundError(f"Configuration file not found for {config_name} ({environment})")
         
-        self.config_cache[cache_key] = config_data
         return config_data
     
     def _try_load_config(self, config_name: str) -> Optional[Dict[str, Any]]:
@@ -63,21 +94,33 @@ class ConfigLoader:
         Returns:
             Dict or None: Configuration data if file exists, None otherwise
         """
-        # Try YAML format
-        yaml_path = os.path.join(self.config_dir, f"{config_name}.yaml")
-        if os.path.exists(yaml_path):
-            return self._load_yaml(yaml_path)
+        path_key = (self.config_dir, config_name)
+        file_path = self._PATH_CACHE.get(path_key)
+        if file_path is None:
+            file_path = self._find_config_file(config_name)
+            if file_path is None:
+                return None
+            self._PATH_CACHE[path_key] = file_path
         
-        # Try YML format
-        yml_path = os.path.join(self.config_dir, f"{config_name}.yml")
-        if os.path.exists(yml_path):
-            return self._load_yaml(yml_path)
-        
-        # Try JSON format
-        json_path = os.path.join(self.config_dir, f"{config_name}.json")
-        if os.path.exists(json_path):
-            return self._load_json(json_path)
+        if file_path.endswith('.json'):
+            return self._load_json(file_path)
+        return self._load_yaml(file_path)
+    
+    def _find_config_file(self, config_name: str) -> Optional[str]:
+        """
+        Find the configuration file for a name, trying YAML, YML and JSON in order.
         
+        Args:
+            config_name: Name of the configuration file (without extension)
+            
+        Returns:
+            str or None: Path to the configuration file if it exists, None otherwise
+        """
+        base_path = os.path.join(self.config_dir, config_name)
+        for extension in CONFIG_EXTENSIONS:
+            file_path = f"{base_path}{extension}"
+            if os.path.exists(file_path):
+                return file_path
         return None
     
     def _load_yaml(self, file_path: str) -> Dict[str, Any]:
@@ -94,12 +137,12 @@ class ConfigLoader:
             Exception: If YAML file cannot be loaded
         """
         try:
-            with open(file_path, 'r') as file:
-                data = yaml.safe_load(file)
-                self.logger.info(f"Loaded YAML configuration from {file_path}")
-                return data
+            # Copy the cached data so callers cannot modify it for other loaders
+            data = copy.deepcopy(_parse_yaml(file_path, os.path.getmtime(file_path)))
+            logger.info("Loaded YAML configuration from %s", file_path)
+            return data
         except Exception as e:
-            self.logger.error(f"Failed to load YAML configuration from {file_path}: {str(e)}")
+            logger.error("Failed to load YAML configuration from %s: %s", file_path, e)
             raise
     
     def _load_json(self, file_path: str) -> Dict[str, Any]:
@@ -116,12 +159,12 @@ class ConfigLoader:
             Exception: If JSON file cannot be loaded
         """
         try:
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-                self.logger.info(f"Loaded JSON configuration from {file_path}")
-                return data
+            # Copy the cached data so callers cannot modify it for other loaders
+            data = copy.deepcopy(_parse_json(file_path, os.path.getmtime(file_path)))
+            logger.info("Loaded JSON configuration from %s", file_path)
+            return data
         except Exception as e:
-            self.logger.error(f"Failed to load JSON configuration from {file_path}: {str(e)}")
+            logger.error("Failed to load JSON configuration from %s: %s", file_path, e)
             raise
     
     def get_browser_config(self, environment: str = 'default') -> Dict[str, Any]:
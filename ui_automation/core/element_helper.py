@@ -4,8 +4,22 @@ Element helper for UI automation framework.
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from contextlib import contextmanager
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Clicks the checkbox in arguments[0] if its state differs from arguments[1];
+# returns whether it was clicked. Elements without a checked property count as
+# unchecked, as with is_selected()
+SET_CHECKED_SCRIPT = """
+if (!!arguments[0].checked !== arguments[1]) {
+    arguments[0].click();
+    return true;
+}
+return false;
+"""
+
 class ElementHelper:
     """Helper class for interacting with web elements."""
     
@@ -17,7 +31,85 @@ class ElementHelper:
             browser: WebDriver instance
         """
         self.browser = browser
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        self._actions = None
+        self._pending_scripts = None
+    
+    @contextmanager
+    def batch_scripts(self):
+        """
+        Batch page scripts that take no arguments into a single call.
+        
+        Inside the block scroll_to_top and scroll_to_bottom are queued
+        instead of sent. Queued scripts are sent together with the next
+        script-based helper call, before the next action (hover, clicks,
+        drag and drop, key presses, dropdown selection), or when the
+        block exits.
+        """
+        if self._pending_scripts is not None:
+            yield
+            return
+        
+        self._pending_scripts = []
+        try:
+            yield
+        finally:
+            try:
+                self.flush_scripts()
+            finally:
+                self._pending_scripts = None
+    
+    def flush_scripts(self):
+        """Send all queued scripts in a single call."""
+        if self._pending_scripts:
+            script = "\n".join(self._pending_scripts)
+            self._pending_scripts.clear()
+            self.browser.execute_script(script)
+    
+    def _queue_script(self, script):
+        """
+        Queue a script that takes no arguments when batching, otherwise run it.
+        
+        Args:
+            script: JavaScript statement(s) to run
+        """
+        if self._pending_scripts is None:
+            self.browser.execute_script(script)
+        else:
+            self._pending_scripts.append(script)
+    
+    def _execute(self, script, *args):
+        """
+        Run a script, prefixed with any queued scripts so they share the call.
+        
+        Args:
+            script: JavaScript to execute
+            *args: Arguments to pass to the script
+            
+        Returns:
+            The result of the script execution
+        """
+        if self._pending_scripts:
+            script = "\n".join(self._pending_scripts + [script])
+            self._pending_scripts.clear()
+        return self.browser.execute_script(script, *args)
+    
+    def _action_chain(self):
+        """
+        Get the reusable ActionChains instance with an empty action queue.
+        
+        Only the locally queued actions are cleared; ActionChains.reset_actions
+        would also send a release-actions command to the browser.
+        
+        Returns:
+            ActionChains: Action chain for the browser
+        """
+        if self._actions is None:
+            self._actions = ActionChains(self.browser)
+        else:
+            for device in self._actions.w3c_actions.devices:
+                device.clear_actions()
+        return self._actions
     
     def select_dropdown_by_text(self, element, text):
         """
@@ -27,9 +119,10 @@ class ElementHelper:
             element: Select WebElement
             text: Option text to select
         """
+        self.flush_scripts()
         select = Select(element)
         select.select_by_visible_text(text)
-        self.logger.info(f"Selected dropdown option with text: {text}")
+        logger.info("Selected dropdown option with text: %s", text)
     
     def select_dropdown_by_value(self, element, value):
         """
@@ -39,9 +132,10 @@ class ElementHelper:
             element: Select WebElement
             value: Option value to select
         """
+        self.flush_scripts()
         select = Select(element)
         select.select_by_value(value)
-        self.logger.info(f"Selected dropdown option with value: {value}")
+        logger.info("Selected dropdown option with value: %s", value)
     
     def select_dropdown_by_index(self, element, index):
         """
@@ -51,9 +145,10 @@ class ElementHelper:
             element: Select WebElement
             index: Option index to select
         """
+        self.flush_scripts()
         select = Select(element)
         select.select_by_index(index)
-        self.logger.info(f"Selected dropdown option with index: {index}")
+        logger.info("Selected dropdown option with index: %s", index)
     
     def get_dropdown_selected_text(self, element):
         """
@@ -65,6 +160,7 @@ class ElementHelper:
         Returns:
             str: Selected option text
         """
+        self.flush_scripts()
         select = Select(element)
         return select.first_selected_option.text
     
@@ -72,14 +168,19 @@ class ElementHelper:
         """
         Get all options from dropdown.
         
+        The texts are read with a single script call instead of one call
+        per option.
+        
         Args:
             element: Select WebElement
             
         Returns:
             List[str]: List of option texts
         """
-        select = Select(element)
-        return [option.text for option in select.options]
+        return self._execute(
+            "return Array.from(arguments[0].options, function (o) { return o.text; });",
+            element
+        )
     
     def hover_over_element(self, element):
         """
@@ -88,9 +189,9 @@ class ElementHelper:
         Args:
             element: WebElement to hover over
         """
-        actions = ActionChains(self.browser)
-        actions.move_to_element(element).perform()
-        self.logger.info("Hovered over element")
+        self.flush_scripts()
+        self._action_chain().move_to_element(element).perform()
+        logger.info("Hovered over element")
     
     def drag_and_drop(self, source_element, target_element):
         """
@@ -100,9 +201,9 @@ class ElementHelper:
             source_element: Source WebElement
             target_element: Target WebElement
         """
-        actions = ActionChains(self.browser)
-        actions.drag_and_drop(source_element, target_element).perform()
-        self.logger.info("Performed drag and drop")
+        self.flush_scripts()
+        self._action_chain().drag_and_drop(source_element, target_element).perform()
+        logger.info("Performed drag and drop")
     
     def right_click(self, element):
         """
@@ -111,9 +212,9 @@ class ElementHelper:
         Args:
             element: WebElement to right-click on
         """
-        actions = ActionChains(self.browser)
-        actions.context_click(element).perform()
-        self.logger.info("Performed right-click")
+        self.flush_scripts()
+        self._action_chain().context_click(element).perform()
+        logger.info("Performed right-click")
     
     def double_click(self, element):
         """
@@ -122,9 +223,9 @@ class ElementHelper:
         Args:
             element: WebElement to double-click on
         """
-        actions = ActionChains(self.browser)
-        actions.double_click(element).perform()
-        self.logger.info("Performed double-click")
+        self.flush_scripts()
+        self._action_chain().double_click(element).perform()
+        logger.info("Performed double-click")
     
     def press_key(self, element, key):
         """
@@ -134,8 +235,9 @@ class ElementHelper:
             element: WebElement
             key: Key to press (use Keys class)
         """
+        self.flush_scripts()
         element.send_keys(key)
-        self.logger.info(f"Pressed key: {key}")
+        logger.info("Pressed key: %s", key)
     
     def press_enter(self, element):
         """
@@ -171,18 +273,18 @@ class ElementHelper:
         Args:
             element: WebElement to scroll to
         """
-        self.browser.execute_script("arguments[0].scrollIntoView(true);", element)
-        self.logger.info("Scrolled to element")
+        self._execute("arguments[0].scrollIntoView(true);", element)
+        logger.info("Scrolled to element")
     
     def scroll_to_top(self):
-        """Scroll to the top of the page."""
-        self.browser.execute_script("window.scrollTo(0, 0);")
-        self.logger.info("Scrolled to top of page")
+        """Scroll to the top of the page (queued inside batch_scripts)."""
+        self._queue_script("window.scrollTo(0, 0);")
+        logger.info("Scrolled to top of page")
     
     def scroll_to_bottom(self):
-        """Scroll to the bottom of the page."""
-        self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        self.logger.info("Scrolled to bottom of page")
+        """Scroll to the bottom of the page (queued inside batch_scripts)."""
+        self._queue_script("window.scrollTo(0, document.body.scrollHeight);")
+        logger.info("Scrolled to bottom of page")
     
     def is_checkbox_checked(self, element):
         """
@@ -194,29 +296,32 @@ class ElementHelper:
         Returns:
             bool: True if checked, False otherwise
         """
+        self.flush_scripts()
         return element.is_selected()
     
     def check_checkbox(self, element):
         """
         Check a checkbox if not already checked.
         
+        The state is read and changed in a single script call.
+        
         Args:
             element: Checkbox WebElement
         """
-        if not self.is_checkbox_checked(element):
-            element.click()
-            self.logger.info("Checked checkbox")
+        if self._execute(SET_CHECKED_SCRIPT, element, True):
+            logger.info("Checked checkbox")
     
     def uncheck_checkbox(self, element):
         """
         Uncheck a checkbox if already checked.
         
+        The state is read and changed in a single script call.
+        
         Args:
             element: Checkbox WebElement
         """
-        if self.is_checkbox_checked(element):
-            element.click()
-            self.logger.info("Unchecked checkbox")
+        if self._execute(SET_CHECKED_SCRIPT, element, False):
+            logger.info("Unchecked checkbox")
     
     def get_attribute(self, element, attribute):
         """
@@ -229,6 +334,7 @@ class ElementHelper:
         Returns:
             str: Attribute value
         """
+        self.flush_scripts()
         return element.get_attribute(attribute)
     
     def get_css_value(self, element, property_name):
@@ -242,6 +348,7 @@ class ElementHelper:
         Returns:
             str: CSS property value
         """
+        self.flush_scripts()
         return element.value_of_css_property(property_name)
     
     def is_element_enabled(self, element):
@@ -254,6 +361,7 @@ class ElementHelper:
         Returns:
             bool: True if enabled, False otherwise
         """
+        self.flush_scripts()
         return element.is_enabled()
     
     def is_element_displayed(self, element):
@@ -266,4 +374,5 @@ class ElementHelper:
         Returns:
             bool: True if displayed, False otherwise
         """
+        self.flush_scripts()
         return element.is_displayed()
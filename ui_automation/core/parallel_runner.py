@@ -0,0 +1,113 @@
+"""
+Parallel runner for UI automation framework.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from ui_automation.core.browser_factory import BrowserFactory
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class ParallelRunner:
+    """Class for running tests in parallel, one browser per worker thread."""
+    
+    def __init__(self, workers=4, browser_type="chrome", headless=False, browser_factory=None):
+        """
+        Initialize the parallel runner.
+        
+        Args:
+            workers: Number of worker threads (and browsers)
+            browser_type: Type of browser ('chrome', 'firefox', 'edge', 'safari')
+            headless: Whether to run in headless mode
+            browser_factory: BrowserFactory to create browsers with (default: a factory owned
+                by the runner, whose browsers are quit on close)
+        """
+        self.logger = logger
+        self.workers = workers
+        self.browser_type = browser_type
+        self.headless = headless
+        self._owns_factory = browser_factory is None
+        self.browser_factory = browser_factory or BrowserFactory(pool_size=workers)
+        
+        self._local = threading.local()
+        self._browsers = []
+        self._lock = threading.Lock()
+        self._executor = None
+    
+    def get_browser(self):
+        """
+        Get the browser owned by the current worker thread, creating it on first use.
+        
+        WebDriver is not thread-safe, so each worker thread gets its own browser.
+        
+        Returns:
+            WebDriver: Browser instance
+        """
+        browser = getattr(self._local, 'browser', None)
+        if browser is None:
+            browser = self.browser_factory.create_browser(
+                browser_type=self.browser_type,
+                headless=self.headless
+            )
+            self._local.browser = browser
+            with self._lock:
+                self._browsers.append(browser)
+        return browser
+    
+    def run(self, tests):
+        """
+        Run tests in parallel.
+        
+        Args:
+            tests: Iterable of callables, each taking a WebDriver instance
+        
+        Returns:
+            List: Results of the tests, in the order given
+        
+        Raises:
+            Exception: The first exception raised by a test
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix='ui_automation_worker'
+            )
+        
+        logger.info("Running tests with %s workers", self.workers)
+        return list(self._executor.map(self._run_test, tests))
+    
+    def _run_test(self, test):
+        """
+        Run a single test with the current worker's browser.
+        
+        Args:
+            test: Callable taking a WebDriver instance
+        
+        Returns:
+            The result of the test
+        """
+        return test(self.get_browser())
+    
+    def close(self):
+        """
+        Stop the worker threads and clean up their browsers.
+        
+        Browsers are quit if the runner created its own factory, and released
+        to the browser pool for reuse if a factory was passed in.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        with self._lock:
+            browsers = self._browsers
+            self._browsers = []
+        
+        if self._owns_factory:
+            for browser in browsers:
+                self.browser_factory.quit_browser(browser)
+            logger.info("Quit %s worker browsers", len(browsers))
+        else:
+            for browser in browsers:
+                self.browser_factory.release_browser(browser)
+            logger.info("Released %s worker browsers", len(browsers))
@@ -3,10 +3,27 @@ HTML reporter for UI automation framework.
 """
 import os
 import time
-from datetime import datetime
+from collections import ChainMap
 import logging
 import jinja2
 import shutil
+import tempfile
+from ui_automation._paths import REPORTS_DIR
+
+logger = logging.getLogger(__name__)
+
+# Write buffer for report files, large enough to hold a typical report in one write
+REPORT_BUFFER_SIZE = 1 << 18
+
+# Report template files, relative to the templates directory. The prelude and
+# epilogue are static and written as-is; only the body is rendered by Jinja
+REPORT_PRELUDE = 'prelude.html'
+REPORT_TEMPLATE = 'report_body.html'
+REPORT_EPILOGUE = 'epilogue.html'
+
+# Single-file template created by earlier versions. If present it may have been
+# customised, so it is rendered whole in place of the prelude/body/epilogue split
+LEGACY_TEMPLATE = 'report_template.html'
 
 class HtmlReporter:
     """Class for generating HTML test reports."""
@@ -18,28 +35,47 @@ class HtmlReporter:
         Args:
             report_dir: Directory for reports (default: project_root/reports)
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         if report_dir is None:
             # Default report directory is project_root/reports
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            self.report_dir = os.path.join(project_root, 'reports')
+            self.report_dir = REPORTS_DIR
         else:
             self.report_dir = report_dir
         
-        # Create report directory if it doesn't exist
-        os.makedirs(self.report_dir, exist_ok=True)
-        
         # Initialize Jinja2 environment
         template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
-        if not os.path.exists(template_dir):
-            os.makedirs(template_dir, exist_ok=True)
-            self._create_default_template(template_dir)
+        if os.path.exists(os.path.join(template_dir, LEGACY_TEMPLATE)):
+            self.logger.warning(
+                f"Rendering legacy report template {LEGACY_TEMPLATE} as a whole; "
+                f"remove it to use the default {REPORT_TEMPLATE} template"
+            )
+            self._template_name = LEGACY_TEMPLATE
+            self._prelude = self._epilogue = b''
+        else:
+            if not all(os.path.exists(os.path.join(template_dir, name))
+                       for name in (REPORT_PRELUDE, REPORT_TEMPLATE, REPORT_EPILOGUE)):
+                os.makedirs(template_dir, exist_ok=True)
+                self._create_default_template(template_dir)
+            
+            # Static parts of the report, kept encoded so they are written without rendering
+            self._template_name = REPORT_TEMPLATE
+            with open(os.path.join(template_dir, REPORT_PRELUDE), 'rb') as file:
+                self._prelude = file.read()
+            with open(os.path.join(template_dir, REPORT_EPILOGUE), 'rb') as file:
+                self._epilogue = file.read()
         
         self.jinja_env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(template_dir),
             autoescape=jinja2.select_autoescape(['html', 'xml'])
         )
+        
+        # Format durations inside the template; must be registered before compiling
+        self.jinja_env.filters['duration'] = self._format_duration
+        
+        # Report directory and compiled template are set up on the first report
+        self._template_dir = template_dir
+        self._template = None
     
     def generate_report(self, test_results, report_name=None):
         """
@@ -52,9 +88,12 @@ class HtmlReporter:
         Returns:
             str: Path to the generated report
         """
+        # Read the clock once for both the file name and the report timestamp
+        now = time.localtime()
+        
         if report_name is None:
             # Generate name with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S', now)
             report_name = f"test_report_{timestamp}.html"
         
         # Ensure name has .html extension
@@ -65,19 +104,25 @@ class HtmlReporter:
         report_path = os.path.join(self.report_dir, report_name)
         
         try:
-            # Load template
-            template = self.jinja_env.get_template('report_template.html')
+            if self._template is None:
+                self._template = self._load_template()
             
-            # Add timestamp to results
-            test_results['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            test_results['duration'] = self._format_duration(test_results.get('duration', 0))
+            # Layer the timestamp over the results without modifying them
+            extra = {'timestamp': time.strftime('%Y-%m-%d %H:%M:%S', now)}
+            if self._template_name == LEGACY_TEMPLATE:
+                # Legacy templates render {{ duration }} as given, so format it beforehand
+                extra['duration'] = self._format_duration(test_results.get('duration', 0))
+            context = ChainMap(extra, test_results)
             
-            # Render template with test results
-            html_content = template.render(**test_results)
-            
-            # Write to file
-            with open(report_path, 'w', encoding='utf-8') as file:
-                file.write(html_content)
+            # Render the body with test results, writing fragments as they are produced
+            # between the static prelude and epilogue
+            stream = self._template.stream(context)
+            stream.enable_buffering(size=50)
+            with open(report_path, 'wb', buffering=REPORT_BUFFER_SIZE) as file:
+                file.write(self._prelude)
+                for chunk in stream:
+                    file.write(chunk.encode('utf-8'))
+                file.write(self._epilogue)
             
             self.logger.info(f"HTML report generated: {report_path}")
             return report_path
@@ -85,6 +130,64 @@ class HtmlReporter:
             self.logger.error(f"Failed to generate HTML report: {str(e)}")
             raise
     
+    def _load_template(self):
+        """
+        Create the report directory and load the compiled report template.
+        
+        The template is compiled to a Python module once, then loaded as an
+        import. Compiled modules are kept per Jinja version, and are written
+        to a temporary directory and renamed into place, so concurrent
+        processes never import a partly written module.
+        
+        Returns:
+            Template: Compiled report body template
+        """
+        os.makedirs(self.report_dir, exist_ok=True)
+        
+        compiled_dir = os.path.join(self.report_dir, f'.compiled-jinja{jinja2.__version__}')
+        if self._needs_compile(os.path.join(self._template_dir, self._template_name), compiled_dir):
+            self._compile_template(compiled_dir)
+            self.logger.info(f"Compiled HTML report templates into: {compiled_dir}")
+        self.jinja_env.loader = jinja2.ModuleLoader(compiled_dir)
+        return self.jinja_env.get_template(self._template_name)
+    
+    def _compile_template(self, compiled_dir):
+        """
+        Compile the report template into a directory, replacing its module atomically.
+        
+        Args:
+            compiled_dir: Directory holding the compiled template modules
+        """
+        os.makedirs(compiled_dir, exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix='.compiling-', dir=self.report_dir)
+        try:
+            self.jinja_env.compile_templates(
+                staging_dir,
+                zip=None,
+                filter_func=lambda name: name == self._template_name
+            )
+            for name in os.listdir(staging_dir):
+                os.replace(os.path.join(staging_dir, name), os.path.join(compiled_dir, name))
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    def _needs_compile(self, template_path, compiled_dir):
+        """
+        Check whether the compiled template is missing or older than its source.
+        
+        Args:
+            template_path: Path to the template source
+            compiled_dir: Directory holding the compiled template modules
+            
+        Returns:
+            bool: True if the template should be compiled
+        """
+        compiled_path = os.path.join(compiled_dir, jinja2.ModuleLoader.get_module_filename(self._template_name))
+        try:
+            return os.path.getmtime(compiled_path) < os.path.getmtime(template_path)
+        except OSError:
+            return True
+    
     def _format_duration(self, seconds):
         """
         Format duration in seconds to a readable string.
@@ -107,19 +210,16 @@ class HtmlReporter:
     
     def _create_default_template(self, template_dir):
         """
-        Create default HTML report template.
+        Create the default HTML report template files that are missing.
         
         Args:
             template_dir: Directory to create template in
         """
-        template_path = os.path.join(template_dir, 'report_template.html')
-        
-        template_content = """<!DOCTYPE html>
+        prelude_content = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ title|default('UI Automation Test Report') }}</title>
     <style>
         body {
             font-family: Arial, sans-serif;
@@ -215,6 +315,9 @@ class HtmlReporter:
             font-size: 14px;
         }
     </style>
+"""
+        
+        template_content = """    <title>{{ title|default('UI Automation Test Report') }}</title>
 </head>
 <body>
     <div class="container">
@@ -240,7 +343,7 @@ class HtmlReporter:
             </div>
             <div class="summary-item">
                 <div class="summary-label">Duration</div>
-                <div class="summary-value">{{ duration }}</div>
+                <div class="summary-value">{{ duration|default(0)|duration }}</div>
             </div>
         </div>
         
@@ -281,6 +384,10 @@ class HtmlReporter:
                 {% endfor %}
             </tbody>
         </table>
+"""
+        
+        # Jinja drops the body's trailing newline, so the epilogue starts with one
+        epilogue_content = """
         
         <div class="footer">
             <p>Generated by UI Automation Framework</p>
@@ -290,7 +397,14 @@ class HtmlReporter:
 </html>
 """
         
-        with open(template_path, 'w', encoding='utf-8') as file:
-            file.write(template_content)
-        
-        self.logger.info(f"Created default HTML report template: {template_path}")
+        for name, content in ((REPORT_PRELUDE, prelude_content),
+                              (REPORT_TEMPLATE, template_content),
+                              (REPORT_EPILOGUE, epilogue_content)):
+            template_path = os.path.join(template_dir, name)
+            if os.path.exists(template_path):
+                continue
+            
+            with open(template_path, 'w', encoding='utf-8') as file:
+                file.write(content)
+            
+            self.logger.info(f"Created default HTML report template: {template_path}")
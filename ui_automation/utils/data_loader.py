@@ -2,11 +2,112 @@
 Data loader utility for UI automation framework.
 """
 import csv
-import json
 import yaml
 import os
+import copy
+import functools
 import logging
+import operator
 from typing import List, Dict, Any, Union
+from ui_automation._paths import DATA_DIR
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Prefer orjson, which parses straight from bytes, over the stdlib json module
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSON_MODE = 'rb'
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _JSON_MODE = 'r'
+
+logger = logging.getLogger(__name__)
+
+# Number of parsed files kept per format
+PARSE_CACHE_SIZE = 128
+
+def _file_key(file_path: str) -> tuple:
+    """Return the (path, mtime, size) key that parsed file contents are cached under."""
+    stat = os.stat(file_path)
+    return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+def _parse_json(file_path: str) -> Union[Dict[str, Any], List[Any]]:
+    """Parse a JSON file."""
+    encoding = None if _JSON_MODE == 'rb' else 'utf-8'
+    with open(file_path, _JSON_MODE, encoding=encoding) as file:
+        return _json_loads(file.read())
+
+def _read_csv_tuples(file_path: str) -> tuple:
+    """
+    Read a CSV file into its header, a tuple of row tuples and the extra fields.
+    
+    Rows are fitted to the header as csv.DictReader does: short rows are
+    padded with None and long rows are truncated, with the surplus fields
+    kept in a dict keyed by row index.
+    """
+    with open(file_path, 'r', newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        header = tuple(next(reader, ()))
+        width = len(header)
+        
+        rows = []
+        extras = {}
+        for row in reader:
+            # Skip blank lines, as csv.DictReader does
+            if not row:
+                continue
+            if len(row) > width:
+                extras[len(rows)] = tuple(row[width:])
+                row = row[:width]
+            elif len(row) < width:
+                row += [None] * (width - len(row))
+            rows.append(tuple(row))
+        
+        return header, tuple(rows), extras
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _cached_csv(file_path: str, mtime: int, size: int) -> tuple:
+    """Read a CSV file into (header, rows, extras); cached per (path, mtime, size)."""
+    return _read_csv_tuples(file_path)
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _cached_yaml(file_path: str, mtime: int, size: int) -> Union[Dict[str, Any], List[Any]]:
+    """Parse a YAML file; cached per (path, mtime, size). Callers must copy before modifying."""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+def _item_tuples(data: List[Dict[str, Any]], copy_values: bool = False) -> List[tuple]:
+    """
+    Convert a list of objects to tuples of their values, in the first object's key order.
+    
+    With copy_values, rows holding dicts or lists are deep-copied, so tests
+    that modify nested parameters cannot change cached data. Rows of
+    scalars are left as they are.
+    """
+    if not data:
+        return []
+    
+    keys = list(data[0].keys())
+    if len(keys) == 1:
+        key = keys[0]
+        rows = [(item[key],) for item in data]
+    else:
+        # itemgetter builds each tuple in C instead of a generator per row
+        getter = operator.itemgetter(*keys)
+        rows = [getter(item) for item in data]
+    
+    if copy_values:
+        rows = [
+            copy.deepcopy(row) if any(isinstance(value, (dict, list)) for value in row) else row
+            for row in rows
+        ]
+    return rows
 
 class DataLoader:
     """Class for loading test data from various file formats."""
@@ -18,12 +119,11 @@ class DataLoader:
         Args:
             data_dir: Directory containing data files (default: project_root/data)
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         if data_dir is None:
             # Default data directory is project_root/data
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            self.data_dir = os.path.join(project_root, 'data')
+            self.data_dir = DATA_DIR
         else:
             self.data_dir = data_dir
     
@@ -44,11 +144,14 @@ class DataLoader:
         file_path = self._get_file_path(file_name, '.csv')
         
         try:
-            with open(file_path, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                data = [row for row in reader]
-                self.logger.info(f"Loaded {len(data)} rows from CSV file: {file_path}")
-                return data
+            header, rows, extras = _cached_csv(*_file_key(file_path))
+            data = [dict(zip(header, row)) for row in rows]
+            
+            # Surplus fields go under the None key, as with csv.DictReader
+            for index, rest in extras.items():
+                data[index][None] = list(rest)
+            self.logger.info(f"Loaded {len(data)} rows from CSV file: {file_path}")
+            return data
         except FileNotFoundError:
             self.logger.error(f"CSV file not found: {file_path}")
             raise
@@ -73,10 +176,10 @@ class DataLoader:
         file_path = self._get_file_path(file_name, '.json')
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                self.logger.info(f"Loaded JSON data from file: {file_path}")
-                return data
+            # Parse afresh rather than deep-copying the cached data, which is slower
+            data = _parse_json(file_path)
+            self.logger.info(f"Loaded JSON data from file: {file_path}")
+            return data
         except FileNotFoundError:
             self.logger.error(f"JSON file not found: {file_path}")
             raise
@@ -98,21 +201,13 @@ class DataLoader:
             FileNotFoundError: If file is not found
             Exception: If file cannot be loaded
         """
-        # Try both .yaml and .yml extensions
-        try:
-            file_path = self._get_file_path(file_name, '.yaml')
-        except FileNotFoundError:
-            try:
-                file_path = self._get_file_path(file_name, '.yml')
-            except FileNotFoundError:
-                self.logger.error(f"YAML file not found: {file_name}")
-                raise FileNotFoundError(f"YAML file not found: {file_name}")
+        file_path = self._get_yaml_path(file_name)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-                self.logger.info(f"Loaded YAML data from file: {file_path}")
-                return data
+            # Copy the cached data so callers cannot modify it
+            data = copy.deepcopy(_cached_yaml(*_file_key(file_path)))
+            self.logger.info(f"Loaded YAML data from file: {file_path}")
+            return data
         except Exception as e:
             self.logger.error(f"Failed to load YAML file {file_path}: {str(e)}")
             raise
@@ -142,6 +237,28 @@ class DataLoader:
         
         return file_path
     
+    def _get_yaml_path(self, file_name: str) -> str:
+        """
+        Get full path to a YAML file, trying both .yaml and .yml extensions.
+        
+        Args:
+            file_name: Name of the YAML file
+            
+        Returns:
+            str: Full path to the file
+            
+        Raises:
+            FileNotFoundError: If file is not found
+        """
+        try:
+            return self._get_file_path(file_name, '.yaml')
+        except FileNotFoundError:
+            try:
+                return self._get_file_path(file_name, '.yml')
+            except FileNotFoundError:
+                self.logger.error(f"YAML file not found: {file_name}")
+                raise FileNotFoundError(f"YAML file not found: {file_name}")
+    
     def load_test_data(self, file_name: str) -> List[tuple]:
         """
         Load test data for parameterized tests.
@@ -175,19 +292,9 @@ class DataLoader:
         Returns:
             List[tuple]: List of tuples for pytest.mark.parametrize
         """
-        data = self.load_csv(file_name)
-        
-        # Convert list of dicts to list of tuples
-        result = []
-        if data:
-            # Get column names from first row
-            columns = list(data[0].keys())
-            
-            # Create tuples with values in column order
-            for row in data:
-                result.append(tuple(row[col] for col in columns))
-        
-        return result
+        # Rows are already tuples in column order
+        _, rows, _ = _cached_csv(*_file_key(self._get_file_path(file_name, '.csv')))
+        return list(rows)
     
     def _load_test_data_from_json(self, file_name: str) -> List[tuple]:
         """
@@ -199,22 +306,14 @@ class DataLoader:
         Returns:
             List[tuple]: List of tuples for pytest.mark.parametrize
         """
-        data = self.load_json(file_name)
+        # Parse afresh, like load_json; copying cached data would cost more than the parse
+        data = _parse_json(self._get_file_path(file_name, '.json'))
         
         # Expect a list of objects with the same keys
         if not isinstance(data, list):
             raise ValueError(f"JSON test data must be a list of objects: {file_name}")
         
-        result = []
-        if data:
-            # Get keys from first object
-            keys = list(data[0].keys())
-            
-            # Create tuples with values in key order
-            for item in data:
-                result.append(tuple(item[key] for key in keys))
-        
-        return result
+        return _item_tuples(data)
     
     def _load_test_data_from_yaml(self, file_name: str) -> List[tuple]:
         """
@@ -226,19 +325,10 @@ class DataLoader:
         Returns:
             List[tuple]: List of tuples for pytest.mark.parametrize
         """
-        data = self.load_yaml(file_name)
+        data = _cached_yaml(*_file_key(self._get_yaml_path(file_name)))
         
         # Expect a list of objects with the same keys
         if not isinstance(data, list):
             raise ValueError(f"YAML test data must be a list of objects: {file_name}")
         
-        result = []
-        if data:
-            # Get keys from first object
-            keys = list(data[0].keys())
-            
-            # Create tuples with values in key order
-            for item in data:
-                result.append(tuple(item[key] for key in keys))
-        
-        return result
+        return _item_tuples(data, copy_values=True)
@@ -2,8 +2,51 @@
 Logger utility for UI automation framework.
 """
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import time
+from ui_automation._paths import LOGS_DIR
+
+# Write buffer for log files
+LOG_BUFFER_SIZE = 1 << 16
+
+# Number of records collected in memory before they are written to the log file
+LOG_BATCH_SIZE = 1024
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer.
+    
+    Records are flushed to disk when the buffer fills, when the handler is
+    closed (logging flushes all handlers at interpreter exit), or
+    immediately for ERROR and above so failures are never lost. The log
+    directory and file are created on the first write.
+    """
+    
+    def _open(self):
+        """Open the log file with a large write buffer, creating its directory if needed."""
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=self.errors, buffering=LOG_BUFFER_SIZE)
+    
+    def emit(self, record):
+        """
+        Write a record without flushing, unless it is an error.
+        
+        Args:
+            record: LogRecord to write
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 class Logger:
     """Class for setting up and managing logging."""
@@ -22,9 +65,13 @@ class Logger:
         root_logger = logging.getLogger()
         root_logger.setLevel(log_level)
         
-        # Clear existing handlers
+        # Clear existing handlers, closing them so batched records reach their log file
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
         
         # Create console handler
         console_handler = logging.StreamHandler()
@@ -44,29 +91,47 @@ class Logger:
         if log_to_file:
             if log_dir is None:
                 # Default log directory is project_root/logs
-                project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                log_dir = os.path.join(project_root, 'logs')
-            
-            # Create log directory if it doesn't exist
-            os.makedirs(log_dir, exist_ok=True)
+                log_dir = LOGS_DIR
             
             # Create log file with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             log_file = os.path.join(log_dir, f'test_run_{timestamp}.log')
             
-            # Create file handler
-            file_handler = logging.FileHandler(log_file)
+            # Create file handler; the file is not opened until the first write
+            file_handler = _BufferedFileHandler(log_file, delay=True)
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
             
-            # Add file handler to root logger
-            root_logger.addHandler(file_handler)
+            # Collect records in memory and hand them to the file handler in batches;
+            # errors are written through immediately
+            memory_handler = logging.handlers.MemoryHandler(
+                capacity=LOG_BATCH_SIZE,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            memory_handler.setLevel(log_level)
+            
+            # Add batching file handler to root logger
+            root_logger.addHandler(memory_handler)
             
             logging.info(f"Logging to file: {log_file}")
         
         logging.info("Logging setup complete")
         return root_logger
     
+    @staticmethod
+    def flush():
+        """
+        Write all buffered log records to disk.
+        
+        Call at the end of a test session; records are also flushed
+        automatically at interpreter exit.
+        """
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+            if isinstance(handler, logging.handlers.MemoryHandler) and handler.target is not None:
+                handler.target.flush()
+    
     @staticmethod
     def get_logger(name):
         """
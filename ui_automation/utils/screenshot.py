@@ -1,10 +1,56 @@
 """
 Screenshot utility for UI automation framework.
 """
+import atexit
 import os
+import queue
+import threading
 import time
-from datetime import datetime
 import logging
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from ui_automation._paths import SCREENSHOTS_DIR
+
+# Resolves true once the element's top edge lies within the viewport, which
+# scrollIntoView(true) aims for even when the element is taller than the viewport
+IN_VIEW_SCRIPT = (
+    "const r = arguments[0].getBoundingClientRect();"
+    "return r.top >= 0 && r.top < window.innerHeight;"
+)
+
+# Longest wait for a scrolled element to settle in view before capturing anyway
+SCROLL_SETTLE_TIMEOUT = 1.0
+
+logger = logging.getLogger(__name__)
+
+# Screenshots waiting to be written to disk, as (path, png_bytes)
+_WRITE_QUEUE = queue.Queue()
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+
+def _write_screenshots():
+    """Write queued screenshots to disk; runs on the background writer thread."""
+    while True:
+        path, data = _WRITE_QUEUE.get()
+        try:
+            with open(path, 'wb') as file:
+                file.write(data)
+        except Exception as e:
+            logger.error("Failed to write screenshot %s: %s", path, e)
+        finally:
+            _WRITE_QUEUE.task_done()
+
+def _start_writer():
+    """Start the background writer thread if it is not running yet."""
+    global _WRITER
+    
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = threading.Thread(target=_write_screenshots, name="screenshot-writer", daemon=True)
+            _WRITER.start()
+            
+            # The thread is a daemon, so make sure pending writes land before exit
+            atexit.register(Screenshot.flush)
 
 class Screenshot:
     """Class for capturing and managing screenshots."""
@@ -18,22 +64,24 @@ class Screenshot:
             screenshot_dir: Directory for screenshots (default: project_root/screenshots)
         """
         self.browser = browser
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         if screenshot_dir is None:
             # Default screenshot directory is project_root/screenshots
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            self.screenshot_dir = os.path.join(project_root, 'screenshots')
+            self.screenshot_dir = SCREENSHOTS_DIR
         else:
             self.screenshot_dir = screenshot_dir
         
-        # Create screenshot directory if it doesn't exist
-        os.makedirs(self.screenshot_dir, exist_ok=True)
+        # Screenshot directory is created on the first capture
+        self._ensured = False
     
     def capture(self, name=None):
         """
         Capture a screenshot.
         
+        The image is taken synchronously and written to disk by a background
+        thread; call Screenshot.flush to wait until the file exists.
+        
         Args:
             name: Screenshot name (default: timestamp)
             
@@ -42,7 +90,8 @@ class Screenshot:
         """
         if name is None:
             # Generate name with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+            timestamp = f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(seconds))}_{nanoseconds // 1000:06d}"
             name = f"screenshot_{timestamp}"
         
         # Ensure name has .png extension
@@ -53,14 +102,24 @@ class Screenshot:
         screenshot_path = os.path.join(self.screenshot_dir, name)
         
         try:
-            # Capture screenshot
-            self.browser.save_screenshot(screenshot_path)
+            # Capture screenshot and hand it to the writer thread
+            self._ensure_dir()
+            data = self.browser.get_screenshot_as_png()
+            if _WRITER is None:
+                _start_writer()
+            _WRITE_QUEUE.put((screenshot_path, data))
             self.logger.info(f"Screenshot captured: {screenshot_path}")
             return screenshot_path
         except Exception as e:
             self.logger.error(f"Failed to capture screenshot: {str(e)}")
             return None
     
+    def _ensure_dir(self):
+        """Create the screenshot directory if it has not been created yet."""
+        if not self._ensured:
+            os.makedirs(self.screenshot_dir, exist_ok=True)
+            self._ensured = True
+    
     def capture_element(self, element, name=None):
         """
         Capture a screenshot of a specific element.
@@ -75,8 +134,14 @@ class Screenshot:
         # Scroll element into view
         self.browser.execute_script("arguments[0].scrollIntoView(true);", element)
         
-        # Wait for element to be in view
-        time.sleep(0.5)
+        # Wait for element to be in view, polling instead of sleeping a fixed time
+        try:
+            WebDriverWait(self.browser, SCROLL_SETTLE_TIMEOUT, poll_frequency=0.02).until(
+                lambda driver: driver.execute_script(IN_VIEW_SCRIPT, element)
+            )
+        except TimeoutException:
+            # Element may still be scrolling (e.g. smooth scrolling); give it a moment
+            time.sleep(0.05)
         
         # Capture screenshot
         return self.capture(name)
@@ -92,7 +157,12 @@ class Screenshot:
             str: Path to the screenshot file
         """
         # Generate name with test name and timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         name = f"FAIL_{test_name}_{timestamp}.png"
         
         return self.capture(name)
+    
+    @staticmethod
+    def flush():
+        """Wait until all captured screenshots have been written to disk."""
+        _WRITE_QUEUE.join()